@@ -6,6 +6,7 @@ from ansible_collections.waldur.marketplace.plugins.module_utils.waldur.resolver
 )
 from ansible_collections.waldur.marketplace.plugins.module_utils.waldur.base_runner import (
     BaseRunner,
+    clear_shared_lookups,
 )
 
 
@@ -78,9 +79,19 @@ class ActionsRunner(BaseRunner):
         # 6. Execute the action by making the API call.
         command.execute()
         self.has_changed = True
+        # A cached lookup may point at a resource the action just changed or
+        # removed.
+        clear_shared_lookups()
 
-        # 7. Re-fetch the resource to return its state after the action has been performed.
-        self.check_existence()
+        # 7. Determine the resource state after the action has been performed. An
+        # action endpoint that responds with the updated resource itself saves
+        # a round trip; for the usual "scheduled" acknowledgement, the resource
+        # is re-fetched.
+        response = command.response
+        if isinstance(response, dict) and response.get("uuid") == self.resource["uuid"]:
+            self.resource = response
+        else:
+            self.check_existence()
 
         # 8. Exit successfully, reporting the change, the command executed, and the final resource state.
         self.exit(plan=[command])
@@ -13,7 +13,16 @@ composition, leveraging the runner's access to the Ansible module, its context,
 and its API request helper.
 """
 
-from copy import deepcopy
+import hashlib
+from functools import partial
+from typing import Optional
+
+from ansible_collections.waldur.marketplace.plugins.module_utils.waldur.base_runner import (
+    get_shared_lookup,
+    is_uuid,
+    shared_lookups_enabled,
+    store_shared_lookup,
+)
 
 
 class ParameterResolver:
@@ -31,7 +40,7 @@ class ParameterResolver:
       to filter the search for another (e.g., filtering flavors by a resolved offering's tenant).
     """
 
-    def __init__(self, runner):
+    def __init__(self, runner, object_params=()):
         """
         Initializes the resolver.
 
@@ -39,10 +48,23 @@ class ParameterResolver:
             runner: The runner instance (e.g., OrderRunner, CrudRunner) that owns this resolver.
                     This provides access to the Ansible module for error reporting, the context
                     for resolver configuration, and the `send_request` helper for API calls.
+            object_params: The parameters whose full objects the runner reads from `cache`
+                    (e.g. the source and target of a link). They are always fetched, even
+                    when given as a UUID or URL.
         """
         self.runner = runner
         self.module = runner.module
         self.context = runner.context
+        # The resolver configuration is static for a module and consulted at
+        # every level of a recursive resolution, so it is bound once here.
+        self.resolvers = runner.context.get("resolvers", {})
+        # The parameters whose full objects are needed, not just their URLs: those
+        # that some resolver filters by, and those the runner itself reads.
+        self._object_params = frozenset(object_params).union(
+            dep["source_param"]
+            for conf in self.resolvers.values()
+            for dep in (conf or {}).get("filter_by") or []
+        )
 
         # The cache is a critical component for both performance and functionality.
         # - Performance: It stores the full API responses of resolved objects, so if the same
@@ -52,6 +74,21 @@ class ParameterResolver:
         #   'scope_uuid' available for filtering a subsequent 'flavor' lookup.
         self.cache = {}
 
+        # The resolved objects by parameter name and then by user-provided value,
+        # distinguishing different resolutions of the same parameter (e.g. two
+        # different subnets in a `ports` list).
+        self._value_cache = {}
+
+        # Memoizes raw lookups by endpoint, identifier and filters, independently of
+        # the parameter name. Different parameters pointing at the same resource
+        # (or the same parameter resolved through different code paths) therefore
+        # share a single HTTP request per runner invocation.
+        self._lookup_cache = {}
+        # Whether lookups are also shared through the process-wide cache, and
+        # the result of `_credentials_scope`, computed on first use.
+        self._share_lookups = shared_lookups_enabled()
+        self._scope = None
+
     def prime_cache_from_resource(self, resource: dict, keys: list[str]):
         """
         Primes the resolver's cache with top-level dependency objects from an
@@ -69,14 +106,19 @@ class ParameterResolver:
             keys: A list of keys on the resource object (e.g., ["offering", "project"])
                   to proactively fetch and cache.
         """
-        for key in keys:
-            # Check if the resource has the key and we haven't already cached it.
-            if resource.get(key) and key not in self.cache:
-                # The value (e.g., resource['offering']) is a URL.
-                # We make a GET request to that URL to fetch the full object.
-                obj_data, _ = self.runner.send_request("GET", resource[key])
-                if obj_data:
-                    self.cache[key] = obj_data
+        # Only keys the resource has and that are not cached yet are fetched.
+        # Their values (e.g., resource['offering']) are URLs, and the objects
+        # behind them are independent, so they are fetched concurrently.
+        to_fetch = [key for key in keys if resource.get(key) and key not in self.cache]
+        responses = self.runner._run_concurrently(
+            [
+                partial(self.runner.send_request, "GET", resource[key])
+                for key in to_fetch
+            ]
+        )
+        for key, (obj_data, _) in zip(to_fetch, responses):
+            if obj_data:
+                self.cache[key] = obj_data
 
     def resolve_to_url(self, param_name: str, value: str) -> str:
         """
@@ -93,34 +135,31 @@ class ParameterResolver:
             The fully qualified URL of the resolved resource.
         """
         # Retrieve the specific resolver configuration for this parameter from the context.
-        resolver_conf = self.context.get("resolvers", {}).get(param_name)
+        resolver_conf = self.resolvers.get(param_name)
         if not resolver_conf:
-            self.module.fail_json(
+            self.runner.fail_json(
                 msg=f"Configuration error: No resolver found for parameter '{param_name}'."
             )
             return ""  # Unreachable
 
         # Optimization: If the user provides a UUID, we can construct the URL
         # directly without a search query, which is much more efficient.
-        if self.runner._is_uuid(value):
-            api_url = self.module.params["api_url"].rstrip("/")
-            list_path = resolver_conf["url"].strip("/")
-            return f"{api_url}/{list_path}/{value}/"
+        if is_uuid(value):
+            return self._url_for_uuid(resolver_conf, value)
 
         # Optimization: If the user provides a full URL, we can use it directly.
         if isinstance(value, str) and value.startswith(("http://", "https://")):
             return value
 
         # Check cache first
-        cache_key = (param_name, value)
-        if cache_key in self.cache:
-            return self.cache[cache_key]["url"]
+        cached_object = self._cached_object(param_name, value)
+        if cached_object is not None:
+            return cached_object["url"]
 
         # If it's a name, perform a search using the configured list endpoint.
         # Use the configured query parameter name, defaulting to 'name_exact' for backward compatibility.
-        name_query_param = resolver_conf.get("name_query_param", "name_exact")
-        response, _ = self.runner.send_request(
-            "GET", resolver_conf["url"], query_params={name_query_param: value}
+        response = self._resolve_to_list(
+            resolver_conf["url"], value, None, resolver_conf
         )
 
         # Handle the results of the search.
@@ -129,11 +168,11 @@ class ParameterResolver:
                 resolver_conf.get("error_message") or "Resource '{value}' not found."
             )
             error_msg = error_template.format(value=value)
-            self.module.fail_json(msg=error_msg)
+            self.runner.fail_json(msg=error_msg)
             return ""  # Unreachable
 
         if len(response) > 1:
-            self.module.fail_json(
+            self.runner.fail_json(
                 msg=(
                     f"Multiple resources found for '{value}' (parameter '{param_name}'). "
                     f"Found {len(response)} matches. This resource name is not unique. "
@@ -144,7 +183,7 @@ class ParameterResolver:
         # Return the 'url' field from the first matching resource.
         # Cache the full object before returning the URL
         resolved_object = response[0]
-        self.cache[cache_key] = resolved_object
+        self._value_cache.setdefault(param_name, {})[value] = resolved_object
         if param_name in self.module.params:
             self.cache[param_name] = resolved_object
 
@@ -170,39 +209,54 @@ class ParameterResolver:
             The fully resolved data structure, with all names/UUIDs replaced by
             their API-ready, formatted values.
         """
-        resolver_conf = self.context["resolvers"].get(param_name)
+        resolver_conf = self.resolvers.get(param_name)
 
         # --- Recursive Cases ---
 
         # Case 1: The value is a dictionary (e.g., a single item from a `ports` list).
         if isinstance(param_value, dict):
-            resolved_dict = deepcopy(param_value)
-            # Iterate through the dictionary's items and recurse. The dictionary key
-            # becomes the new `param_name` context for the next level down.
-            for key, value in param_value.items():
-                # Pass the hint down during recursion
-                resolved_dict[key] = self.resolve(
-                    key, value, output_format=output_format
-                )
-            return resolved_dict
+            return self._resolve_dict(param_value, output_format)
 
         # Case 2: The value is a list.
         if isinstance(param_value, list):
             # This is a critical distinction:
             # A) A list of simple, resolvable items (e.g., security_groups: ['sg-web', 'sg-db']).
             #    The resolver config for `security_groups` will have `is_list: true`.
+            #    The items are independent lookups, so they are resolved
+            #    concurrently. Shared dependencies (e.g. the tenant the groups
+            #    are filtered by) are resolved once beforehand, so that every
+            #    item finds them in the cache.
             if resolver_conf and resolver_conf.get("is_list"):
-                return [
-                    self._resolve_single_value(
-                        param_name, item, resolver_conf, output_format=output_format
+                if len(param_value) > 1:
+                    self._build_dependency_filters(
+                        param_name, resolver_conf.get("filter_by") or []
                     )
-                    for item in param_value
-                ]
+                return self.runner._run_concurrently(
+                    [
+                        partial(
+                            self._resolve_single_value,
+                            param_name,
+                            item,
+                            resolver_conf,
+                            output_format=output_format,
+                        )
+                        for item in param_value
+                    ]
+                )
             # B) A list of complex objects (e.g., ports: [{'subnet': 'net-A'}, {'subnet': 'net-B'}]).
-            #    We just recurse into each object in the list.
+            #    We just recurse into each object in the list. Objects, the
+            #    usual case, are handed to the dictionary walker directly.
             else:
                 return [
-                    self.resolve(param_name, item, output_format=output_format)
+                    (
+                        self._resolve_dict(item, output_format)
+                        if isinstance(item, dict)
+                        else (
+                            self.resolve(param_name, item, output_format=output_format)
+                            if self._needs_resolution(param_name, item)
+                            else item
+                        )
+                    )
                     for item in param_value
                 ]
 
@@ -215,16 +269,116 @@ class ParameterResolver:
                 param_name, param_value, resolver_conf, output_format=output_format
             )
             # Ensure the simple cache is populated if this was a top-level parameter
-            if (
-                param_name in self.module.params
-                and (param_name, param_value) in self.cache
-            ):
-                self.cache[param_name] = self.cache[(param_name, param_value)]
+            if param_name in self.module.params:
+                cached_object = self._cached_object(param_name, param_value)
+                if cached_object is not None:
+                    self.cache[param_name] = cached_object
             return resolved_value
 
         # If it's a primitive with no resolver, return it unchanged.
         return param_value
 
+    def resolve_many(self, values: dict, output_format: str = "create") -> dict:
+        """
+        Resolves several top-level parameters at once, issuing independent API
+        lookups concurrently.
+
+        Parameters are processed in dependency "waves". A parameter joins a wave
+        only when none of the `filter_by` sources it relies on are still waiting
+        to be resolved in this batch, so a dependent lookup always finds its
+        parent object in the cache, exactly as it would in a sequential run.
+        Parameters without any configured resolver are returned unchanged
+        without being scheduled at all.
+
+        Args:
+            values: A mapping of parameter names to user-provided values.
+            output_format: A hint for the desired output format ('create' or 'update_action').
+
+        Returns:
+            A mapping of parameter names to resolved values, in the input order.
+        """
+        resolved = {}
+        pending = {}
+        for name, value in values.items():
+            needs_lookup, dependencies = self._scan_dependencies(name, value)
+            if needs_lookup:
+                pending[name] = dependencies - {name}
+            else:
+                resolved[name] = value
+
+        while pending:
+            ready = [
+                name for name, deps in pending.items() if not deps & pending.keys()
+            ]
+            # A dependency cycle cannot be ordered; resolve the remainder together.
+            if not ready:
+                ready = list(pending)
+
+            results = self.runner._run_concurrently(
+                [
+                    partial(
+                        self.resolve, name, values[name], output_format=output_format
+                    )
+                    for name in ready
+                ]
+            )
+            for name, result in zip(ready, results):
+                resolved[name] = result
+                del pending[name]
+
+        return {name: resolved[name] for name in values}
+
+    def _scan_dependencies(self, param_name: str, param_value: any) -> tuple:
+        """
+        Walks a parameter's value structure the same way `resolve` does and
+        reports whether any part of it needs an API lookup, along with the
+        names of the parameters those lookups are filtered by.
+
+        Returns:
+            A `(needs_lookup, dependencies)` tuple.
+        """
+        resolvers = self.resolvers
+        needs_lookup = False
+        dependencies = set()
+        stack = [(param_name, param_value)]
+        while stack:
+            name, value = stack.pop()
+            if isinstance(value, dict):
+                stack.extend(value.items())
+            elif isinstance(value, list):
+                stack.extend((name, item) for item in value)
+            elif resolvers.get(name):
+                needs_lookup = True
+                for dep in resolvers[name].get("filter_by") or []:
+                    dependencies.add(dep["source_param"])
+        return needs_lookup, dependencies
+
+    def _resolve_dict(self, param_value: dict, output_format: str) -> dict:
+        """
+        Resolves every item of a dictionary (e.g., a single item from a `ports`
+        list) and returns the result as a new dictionary.
+        """
+        # The dictionary key becomes the new `param_name` context for the next
+        # level down. Every value is replaced by the recursive call, so the
+        # input is never copied up front. Plain values without a resolver, which
+        # make up most of a payload, are copied over without a recursive call.
+        return {
+            key: (
+                self.resolve(key, value, output_format=output_format)
+                if self._needs_resolution(key, value)
+                else value
+            )
+            for key, value in param_value.items()
+        }
+
+    def _needs_resolution(self, param_name: str, value: any) -> bool:
+        """
+        Checks whether `resolve` would change a value: containers are walked,
+        and primitives are resolved only when a resolver is configured for
+        their parameter. Any other value is returned by `resolve` unchanged.
+        """
+        return isinstance(value, (dict, list)) or bool(self.resolvers.get(param_name))
+
     def _resolve_single_value(
         self,
         param_name: str,
@@ -246,20 +400,27 @@ class ParameterResolver:
         Returns:
             The resolved and formatted value, ready for the API payload.
         """
+        params = self.module.params
+        filter_by = resolver_conf.get("filter_by") or []
+
+        # Step 0: A full URL (e.g. a value taken from an existing resource) is
+        # already API-ready, and the URL for a UUID can be built locally. Either
+        # is used without fetching the object, unless the object itself is
+        # needed for dependency filtering or validation.
+        if self.url_is_sufficient(param_name):
+            if isinstance(value, str) and value.startswith(("http://", "https://")):
+                return self._format_url(value, resolver_conf, output_format)
+            if is_uuid(value):
+                url = self._url_for_uuid(resolver_conf, value)
+                return self._format_url(url, resolver_conf, output_format)
+
         # Step 1: Build a dictionary of query parameters needed for this lookup
         # by checking for `filter_by` dependencies.
-        query_params = self._build_dependency_filters(
-            param_name, resolver_conf.get("filter_by", [])
-        )
+        query_params = self._build_dependency_filters(param_name, filter_by)
 
         # Step 2: Check the cache first to avoid a network call.
-        # Use a tuple as a cache key to distinguish between different resolutions for the
-        # same parameter name (e.g., resolving two different subnets in a `ports` list).
-
-        cache_key = (param_name, value)
-        if cache_key in self.cache:
-            resolved_object = self.cache[cache_key]
-        else:
+        resolved_object = self._cached_object(param_name, value)
+        if resolved_object is None:
             # If not in cache, perform the API lookup.
             resource_list = self._resolve_to_list(
                 resolver_conf["url"], value, query_params, resolver_conf
@@ -270,10 +431,10 @@ class ParameterResolver:
                     resolver_conf.get("error_message")
                     or "Resource '{value}' not found."
                 )
-                self.module.fail_json(msg=error_template.format(value=value))
+                self.runner.fail_json(msg=error_template.format(value=value))
                 return None  # Unreachable
             if len(resource_list) > 1:
-                self.module.fail_json(
+                self.runner.fail_json(
                     msg=(
                         f"Multiple resources found for '{value}' (parameter '{param_name}'). "
                         f"Found {len(resource_list)} matches. This resource name is not unique. "
@@ -285,30 +446,25 @@ class ParameterResolver:
             try:
                 resolved_object = resource_list[0]
             except (TypeError, KeyError, IndexError) as e:
-                self.module.fail_json(
+                self.runner.fail_json(
                     msg=f"Unexpected API response structure for '{param_name}'. Expected a list, got {type(resource_list)}. Response: {resource_list}. Error: {e}"
                 )
                 return None
-            # Populate the tuple-key cache to avoid re-fetching this specific item.
-            self.cache[cache_key] = resolved_object
-
-            # Also populate the simple cache key for dependency lookups
-            # if this is a top-level parameter, making the cache robust.
-            if param_name in self.module.params:
-                self.cache[param_name] = resolved_object
+            # Populate the value cache to avoid re-fetching this specific item.
+            self._value_cache.setdefault(param_name, {})[value] = resolved_object
 
         # --- Validation Step ---
         # Ensure that the resolved object actually complies with the dependencies
         # specified by the user. For example, if the user asked for Project A
         # and Customer B, we must ensure Project A actually belongs to Customer B.
-        if resolver_conf.get("filter_by"):
-            for dep in resolver_conf["filter_by"]:
+        if filter_by:
+            for dep in filter_by:
                 source_param = dep["source_param"]
                 # Only validate if the user explicitly provided the dependency parameter.
                 # If it was implicitly resolved or default, we assume it's correct/harmless.
-                if self.module.params.get(source_param):
+                if params.get(source_param):
                     # Get the expected value (e.g., the UUID of Customer B)
-                    expected_value = self.module.params[source_param]
+                    expected_value = params[source_param]
 
                     # Get the actual value from the resolved object (e.g., Project A's customer_uuid)
                     # Note: We rely on the 'source_key' mapping from the dependency config.
@@ -322,24 +478,23 @@ class ParameterResolver:
                     # *should* have been resolved and cached already if the order is correct.
 
                     # Let's check the cache for the dependency to get its UUID.
-                    if source_param in self.cache:
-                        dep_obj = self.cache[source_param]
-                        if isinstance(dep_obj, dict):
-                            source_key = dep.get("source_key", "uuid")
-                            expected_uuid = dep_obj.get(source_key)
-                        else:
-                            expected_uuid = None
-                    else:
+                    dep_obj = self.cache.get(source_param)
+                    if dep_obj is None:
                         # Fallback: if not in cache (rare), assume the input might be a UUID
                         expected_uuid = expected_value
+                    elif isinstance(dep_obj, dict):
+                        source_key = dep.get("source_key", "uuid")
+                        expected_uuid = dep_obj.get(source_key)
+                    else:
+                        expected_uuid = None
 
                     # Normalize actual value: it might be a URL or a UUID.
                     actual_uuid = actual_value
                     if isinstance(actual_value, str) and "/" in actual_value:
-                        actual_uuid = actual_value.rstrip("/").split("/")[-1]
+                        actual_uuid = actual_value.rstrip("/").rpartition("/")[2]
 
                     if expected_uuid and actual_uuid and expected_uuid != actual_uuid:
-                        self.module.fail_json(
+                        self.runner.fail_json(
                             msg=(
                                 f"Consistency error: The resolved '{param_name}' ('{value}') "
                                 f"belongs to a different '{source_param}' than specified. "
@@ -351,23 +506,62 @@ class ParameterResolver:
         # Step 3: Populate the simple cache key for dependency lookups.
         # This is the critical fix: ensure this happens on every call (cache hit or miss)
         # for any top-level parameter, making the cache robust for dependencies.
-        if param_name in self.module.params:
+        if param_name in params:
             self.cache[param_name] = resolved_object
 
         # Step 4: Format the return value based on the resolver's configuration and context hint.
+        return self._format_url(resolved_object["url"], resolver_conf, output_format)
+
+    def _url_for_uuid(self, resolver_conf: dict, value: str) -> str:
+        """
+        Builds the URL of a resource from its UUID, without an API call.
+        """
+        list_path = resolver_conf["url"].strip("/")
+        return f"{self.runner.api_url}/{list_path}/{value}/"
+
+    def _format_url(self, url: str, resolver_conf: dict, output_format: str) -> any:
+        """
+        Formats a resolved URL for the API payload, as configured by the
+        resolver for the given output format.
+        """
         if resolver_conf.get("is_list"):
             list_item_keys = resolver_conf.get("list_item_keys", {})
             item_key = list_item_keys.get(output_format)
             if item_key:
-                return {item_key: resolved_object["url"]}
+                return {item_key: url}
         else:
             # For non-list object resolvers (e.g., server_group), wrap the URL in a dict.
             object_item_keys = resolver_conf.get("object_item_keys", {})
             item_key = object_item_keys.get(output_format)
             if item_key:
-                return {item_key: resolved_object["url"]}
+                return {item_key: url}
 
-        return resolved_object["url"]
+        return url
+
+    def url_is_sufficient(self, param_name: str) -> bool:
+        """
+        Checks whether the URL of a parameter is all that is needed, i.e. the
+        full object does not have to be fetched.
+
+        The object is still required when the runner reads it, when another
+        parameter is filtered by one of its fields (e.g. a volume type filtered
+        by the offering's tenant), or when it has to be validated against a
+        parent the user also provided (e.g. a project that must belong to the
+        given customer).
+        """
+        if param_name in self._object_params:
+            return False
+        for dep in (self.resolvers.get(param_name) or {}).get("filter_by") or []:
+            if self.module.params.get(dep["source_param"]):
+                return False
+        return True
+
+    def _cached_object(self, param_name: str, value: any) -> Optional[dict]:
+        """
+        Returns the object already resolved for a parameter value, if any.
+        """
+        values = self._value_cache.get(param_name)
+        return values.get(value) if values else None
 
     def _build_dependency_filters(self, name: str, dependencies: list) -> dict:
         """
@@ -385,21 +579,39 @@ class ParameterResolver:
         Returns:
             A dictionary of query parameters (e.g., `{'tenant_uuid': '...'}`).
         """
+        params = self.module.params
+        # Dependencies the user provided that are not cached yet are resolved up
+        # front. `resolve_many` orders them into waves, so independent ones are
+        # looked up concurrently while one that is itself filtered by another
+        # waits for it. Resolving them populates the cache, from which the
+        # filters are then built.
+        pending = list(
+            dict.fromkeys(
+                dep["source_param"]
+                for dep in dependencies
+                if dep["source_param"] not in self.cache
+                and params.get(dep["source_param"]) is not None
+            )
+        )
+        if len(pending) > 1:
+            self.resolve_many({source: params[source] for source in pending})
+
         query_params = {}
         for dep in dependencies:
             source_param = dep["source_param"]
-            source_object = None
 
             # Priority 1: Check the cache first. This is critical for update scenarios
             # where the dependency info comes from the existing resource, not the user.
-            if source_param in self.cache:
-                source_object = self.cache[source_param]
+            source_object = self.cache.get(source_param)
 
             # Priority 2: If not in cache, check if the user provided the parameter.
             # This handles the "create" or "just-in-time" resolution scenario.
-            elif self.module.params.get(source_param) is not None:
+            if (
+                source_object is None
+                and (user_value := params.get(source_param)) is not None
+            ):
                 # The act of resolving will populate the cache for subsequent lookups.
-                self.resolve(source_param, self.module.params[source_param])
+                self.resolve(source_param, user_value)
                 source_object = self.cache.get(source_param)
 
             # If we satisfied the dependency from either source, build the filter.
@@ -407,7 +619,7 @@ class ParameterResolver:
                 source_value = source_object.get(dep["source_key"])
 
                 if source_value is None:
-                    self.module.fail_json(
+                    self.runner.fail_json(
                         msg=(
                             f"Could not find key '{dep['source_key']}' in the cached "
                             f"response for '{source_param}'. Available keys: {list(source_object.keys())}"
@@ -440,10 +652,68 @@ class ParameterResolver:
 
         Returns:
             A list of matching resource dictionaries. Guarantees returning a list,
-            even if it's empty, to prevent TypeErrors in calling methods.
+            even if it's empty, to prevent TypeErrors in calling methods. Results
+            are memoized for the lifetime of the resolver.
+        """
+        lookup_key = (
+            path,
+            value,
+            tuple(sorted((k, str(v)) for k, v in (query_params or {}).items())),
+            (resolver_conf or {}).get("name_query_param"),
+        )
+        result = self._lookup_cache.get(lookup_key)
+        if result is not None:
+            return result
+
+        if not self._share_lookups:
+            result = self._fetch_matching(path, value, query_params, resolver_conf)
+            self._lookup_cache[lookup_key] = result
+            return result
+
+        # Consult the process-wide cache, which outlives this runner, so that
+        # hosts executing several tasks in one long-lived interpreter (e.g.
+        # Mitogen) can skip repeated lookups across tasks. Entries are scoped to
+        # the API endpoint and the credentials used.
+        if self._scope is None:
+            self._scope = self._credentials_scope()
+        shared_key = (self._scope, lookup_key)
+        result = get_shared_lookup(shared_key)
+        if result is not None:
+            self._lookup_cache[lookup_key] = result
+            return result
+
+        result = self._fetch_matching(path, value, query_params, resolver_conf)
+        self._lookup_cache[lookup_key] = result
+        # Empty results are never shared: the resource may well be created by a
+        # later task.
+        if result:
+            store_shared_lookup(shared_key, result)
+        return result
+
+    def _credentials_scope(self) -> tuple:
+        """
+        Identifies the API endpoint and credentials of the current run, so that
+        entries of the process-wide cache are never served to another user
+        or another Waldur deployment. The token itself is not stored.
+        """
+        token = self.module.params.get("access_token") or ""
+        return (
+            self.runner.api_url,
+            hashlib.sha256(token.encode()).hexdigest(),
+        )
+
+    def _fetch_matching(
+        self,
+        path: str,
+        value: any,
+        query_params: Optional[dict] = None,
+        resolver_conf: Optional[dict] = None,
+    ) -> list:
+        """
+        Performs the uncached lookup behind `_resolve_to_list`.
         """
         # A direct GET by UUID is more efficient and specific than a search.
-        if self.runner._is_uuid(value):
+        if is_uuid(value):
             # A GET to a specific resource returns a dict, not a list. We must
             # normalize this into a list to fulfill this method's contract.
             resource, _ = self.runner.send_request(
@@ -1,19 +1,200 @@
 from abc import abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Optional
 import json
+import os
+import random
+import ssl
+import threading
 import time
-import uuid
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import fetch_url
 
 from .command import Command
 
+# `requests` is optional. API calls go through Ansible's `fetch_url` unless the
+# POOLED_SESSION_ENV environment variable is set to a true value and `requests`
+# is available; all API calls made by a runner then share one pooled session so
+# the TCP/TLS connection is reused between calls.
+try:
+    import requests
+    from urllib3.util.retry import Retry
+
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# `orjson` is optional as well. It (de)serializes request and response bodies
+# several times faster than the standard library, which matters for large list
+# responses. The standard library `json` module is used when it is missing.
+# Both variants parse the raw response bytes and serialize to UTF-8 bytes, which
+# is what goes over the wire, so no intermediate `str` is built.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+# Serializes a value to compact JSON with sorted keys, giving equal values the
+# same string. `json.dumps` builds a new encoder on every call with non-default
+# options, so a single encoder is created up front and reused.
+_canonical_json = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+
+# Timeout, in seconds, applied to every API request.
+REQUEST_TIMEOUT = 30
+
+# Idempotent requests (GET, PUT, DELETE, ...) that fail with a gateway error
+# or a dropped connection are retried by the pooled session, with exponential
+# backoff between attempts. Non-idempotent requests (POST, PATCH) are never
+# retried, since the first attempt may already have been applied.
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Error bodies are read incrementally, in chunks of READ_CHUNK_SIZE bytes.
+READ_CHUNK_SIZE = 64 * 1024
+
+# An error body only ends up in the failure message, so no more than
+# MAX_ERROR_BODY_BYTES of it are read. It is pretty-printed (at -vv) only when
+# it is smaller than PRETTY_ERROR_BODY_BYTES.
+MAX_ERROR_BODY_BYTES = 64 * 1024
+PRETTY_ERROR_BODY_BYTES = 8 * 1024
+
+# Polling of asynchronous tasks uses exponential backoff with "full jitter":
+# the n-th sleep is drawn uniformly from [0, min(interval, 1s * 2**n)]. Quick
+# tasks are detected early, slow ones do not generate excessive API traffic,
+# and many workers polling the same API do not wake up in lockstep. A command's
+# `wait_config` may override the initial delay and the growth rate through its
+# `initial_interval` and `backoff_rate` keys.
+POLL_INITIAL_DELAY = 1.0
+POLL_BACKOFF_RATE = 2
+
 # A map of transformation functions, allowing the generator to configure
 # data conversions (e.g., from user-friendly GiB to API-required MiB).
 TRANSFORMATION_MAP = {"gb_to_mb": lambda x: int(x) * 1024}
 
+# Upper bound on the number of independent API lookups issued at the same time.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Resolver lookups shared by every runner in this Python process. Ansible
+# normally starts a fresh interpreter per task, where sharing buys nothing, so
+# the cache is opt-in: it is only used when the PROCESS_LOOKUP_CACHE_ENV
+# environment variable is set to a true value, for strategies that keep the
+# interpreter alive (e.g. Mitogen) and where consecutive tasks often resolve the
+# same project or offering. Entries are scoped to the API endpoint and
+# credentials, and empty results are never stored. The cache is cleared whenever
+# a runner changes anything (create, update, action or delete) and whenever the
+# API answers with an error, since a resolved object may have been renamed or
+# removed. The least recently used entries are evicted beyond
+# PROCESS_LOOKUP_CACHE_SIZE. It is only accessed through the helpers below.
+PROCESS_LOOKUP_CACHE_ENV = "WALDUR_PROCESS_LOOKUP_CACHE"
+PROCESS_LOOKUP_CACHE = OrderedDict()
+PROCESS_LOOKUP_CACHE_SIZE = 1024
+_PROCESS_LOOKUP_CACHE_LOCK = threading.Lock()
+
+# Pooled `requests` sessions by API scheme and host, shared by every runner in
+# this Python process so that a long-lived interpreter keeps its connections to
+# the Waldur API open from one task to the next. They are opt-in (see
+# POOLED_SESSION_ENV above).
+POOLED_SESSION_ENV = "WALDUR_POOLED_SESSION"
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class _DeferredFailure(Exception):
+    """
+    Carries the arguments of a `fail_json` call made from a worker thread so that
+    the failure can be reported from the main thread instead.
+    """
+
+    def __init__(self, kwargs: dict):
+        super().__init__(kwargs.get("msg"))
+        self.kwargs = kwargs
+
+
+# Characters allowed in a UUID once the dashes are removed.
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def is_uuid(val) -> bool:
+    """
+    Checks if a value is a UUID.
+
+    Both the canonical dashed form and the 32-character hex form used by
+    Waldur are accepted. The length and dash positions are checked first, so
+    most names are rejected without inspecting their characters. This is a
+    plain function so that the resolver can call it without going through
+    the runner.
+    """
+    if not isinstance(val, str):
+        return False
+    if len(val) == 36:
+        if val[8] != "-" or val[13] != "-" or val[18] != "-" or val[23] != "-":
+            return False
+        val = val.replace("-", "")
+    return len(val) == 32 and _HEX_DIGITS.issuperset(val)
+
+
+def shared_lookups_enabled() -> bool:
+    """
+    Checks whether the process-wide lookup cache has been enabled through the
+    `PROCESS_LOOKUP_CACHE_ENV` environment variable.
+    """
+    return _env_flag(PROCESS_LOOKUP_CACHE_ENV)
+
+
+def _env_flag(name: str) -> bool:
+    """Checks whether the environment variable `name` is set to a true value."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_shared_lookup(key) -> Optional[list]:
+    """
+    Returns a copy of the lookup result stored in the process-wide cache under
+    `key`, or None, and marks the entry as recently used.
+    """
+    with _PROCESS_LOOKUP_CACHE_LOCK:
+        entry = PROCESS_LOOKUP_CACHE.get(key)
+        if entry is None:
+            return None
+        PROCESS_LOOKUP_CACHE.move_to_end(key)
+    # Callers get their own objects, so changing them never alters the entry.
+    return deepcopy(list(entry))
+
+
+def store_shared_lookup(key, result: list):
+    """
+    Stores a copy of a lookup result in the process-wide cache, evicting the
+    least recently used entries beyond `PROCESS_LOOKUP_CACHE_SIZE`.
+    """
+    entry = tuple(deepcopy(result))
+    with _PROCESS_LOOKUP_CACHE_LOCK:
+        PROCESS_LOOKUP_CACHE[key] = entry
+        PROCESS_LOOKUP_CACHE.move_to_end(key)
+        while len(PROCESS_LOOKUP_CACHE) > PROCESS_LOOKUP_CACHE_SIZE:
+            PROCESS_LOOKUP_CACHE.popitem(last=False)
+
+
+def clear_shared_lookups():
+    """
+    Drops every entry of the process-wide lookup cache.
+    """
+    with _PROCESS_LOOKUP_CACHE_LOCK:
+        PROCESS_LOOKUP_CACHE.clear()
+
 
 class BaseRunner:
     """
@@ -35,9 +216,101 @@ class BaseRunner:
         self.has_changed = False
         self.resource = None
         self.plan = []
-        # Holds the `info` dict (status + headers) of the most recent request.
-        # Used to read pagination metadata such as the 'Link' header.
-        self._last_response_info = {}
+        # The API base URL without a trailing slash, used to build the URL of
+        # every request.
+        self.api_url = module.params["api_url"].rstrip("/")
+        # The standard headers for all API requests. They only depend on the
+        # module parameters, so they are built once and shared by every request.
+        self._headers = {
+            "Authorization": f"token {module.params['access_token']}",
+            "Content-Type": "application/json",
+            # The agent `fetch_url` would send.
+            "User-Agent": module.params.get("http_agent") or "ansible-httpget",
+        }
+        # Holds the `info` dict (status + headers) of the most recent request made
+        # by the current thread. Used to read pagination metadata such as the
+        # 'Link' header. It is thread-local because lookups may run concurrently.
+        # It also marks the worker threads of `_run_concurrently` (`in_worker`).
+        self._local = threading.local()
+        # Raw successful GET responses of this run by URL, as `(body, info)`.
+        # Cleared by every request that is not a GET.
+        self._get_cache = {}
+        # A keep-alive session shared by every request this runner makes
+        # (existence checks, resolver lookups, the change itself and the polling
+        # loop), or None when requests go through `fetch_url`. Like `fetch_url`,
+        # the session honours the proxy environment variables, unless
+        # `use_proxy` is disabled, in which case `fetch_url` is used.
+        self._session = None
+        if (
+            HAS_REQUESTS
+            and _env_flag(POOLED_SESSION_ENV)
+            and module.params.get("use_proxy", True)
+        ):
+            self._session = self._get_session(self.api_url)
+            self._verify = self._tls_verification()
+
+    @classmethod
+    def _get_session(cls, api_url: str):
+        """
+        Returns the pooled session for the host of `api_url`, creating it on
+        first use. The host is parsed once per runner, not per request.
+        """
+        key = urlsplit(api_url)[:2]
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(key)
+            if session is None:
+                session = _SESSIONS[key] = cls._create_session()
+        return session
+
+    @staticmethod
+    def _create_session():
+        """
+        Creates the pooled `requests` session used for all API calls.
+
+        A runner talks to a single Waldur host, so one connection pool is
+        enough. The pool keeps as many connections alive as there can be
+        concurrent lookups (see `_run_concurrently`), so parallel requests
+        reuse their connections instead of opening and discarding new ones.
+
+        Transient failures of idempotent requests are retried by the adapter.
+        Once the retries are exhausted, the last response is returned as is, so
+        it is reported like any other API error.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retry
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _tls_verification(self):
+        """
+        Returns the `verify` argument of session requests, matching the checks of
+        `fetch_url`: none when `validate_certs` is disabled, and otherwise the
+        system trust store, so that private CAs installed on the host are
+        trusted, rather than the CA bundle shipped with `requests`.
+        """
+        if not self.module.params.get("validate_certs", True):
+            return False
+        paths = ssl.get_default_verify_paths()
+        return paths.cafile or paths.capath or True
+
+    def close(self):
+        """
+        Detaches the runner from its pooled session, if any.
+
+        The session itself stays open for later runners in the same process
+        that talk to the same host; its connections are released when the
+        process exits.
+        """
+        self._session = None
 
     @abstractmethod
     def plan_creation(self) -> list:
@@ -110,12 +383,43 @@ class BaseRunner:
         if commands is None:
             commands = [cmd.serialize_request() for cmd in plan] if plan else []
 
+        self.close()
+
         self.module.exit_json(
             changed=self.has_changed,
-            resource=self.resource,
+            resource=self._select_return_fields(self.resource),
             commands=commands,
         )
 
+    def fail_json(self, **kwargs):
+        """
+        Fails the module with the given `fail_json` arguments.
+
+        Code that may run in a worker thread of `_run_concurrently` (API requests
+        and parameter resolution) fails through this method rather than through
+        `module.fail_json`. In a worker, the failure is raised as a
+        `_DeferredFailure` and reported by the calling thread once all workers
+        have finished.
+        """
+        if getattr(self._local, "in_worker", False):
+            raise _DeferredFailure(kwargs)
+        self.module.fail_json(**kwargs)
+
+    def _select_return_fields(self, resource):
+        """
+        Trims a resource down to the fields listed in the optional
+        `return_fields` context key before it is returned to Ansible.
+
+        Some Waldur resources (e.g. offerings with many components) are large,
+        and serializing and transferring every nested field can dominate the
+        runtime of a module whose users only read a few of them. Without
+        `return_fields`, the resource is returned unchanged.
+        """
+        return_fields = self.context.get("return_fields")
+        if not return_fields or not isinstance(resource, dict):
+            return resource
+        return {field: resource.get(field) for field in return_fields}
+
     def execute_change_plan(self, plan: list):
         """
         Executes a list of Command objects, making the actual API calls and
@@ -125,9 +429,14 @@ class BaseRunner:
             return
 
         self.has_changed = True
+        # The same for every command of the plan.
+        wait = self.module.params.get("wait", True)
 
         for command in plan:
             result = command.execute()
+            # A cached lookup may point at a resource that was just renamed,
+            # changed or removed, or miss one that was just created.
+            clear_shared_lookups()
 
             # Update runner's internal state based on the type of command executed.
             if command.command_type == "create":
@@ -144,9 +453,10 @@ class BaseRunner:
             # For 'action' commands, the resource state is typically updated by the waiter.
 
             # --- Generic Waiting Logic ---
-            if command.wait_config and self.module.params.get("wait", True):
+            wait_config = command.wait_config
+            if wait_config and wait:
                 # Determine the UUID to poll based on the command's context.
-                uuid_source_config = command.wait_config.get("uuid_source", {})
+                uuid_source_config = wait_config.get("uuid_source", {})
                 uuid_source_location = uuid_source_config.get("location")
                 uuid_key = uuid_source_config.get("key")
                 uuid_to_poll = None
@@ -158,9 +468,9 @@ class BaseRunner:
 
                 if uuid_to_poll:
                     self._wait_for_completion(
-                        polling_path=command.wait_config["polling_path"],
+                        polling_path=wait_config["polling_path"],
                         resource_uuid=uuid_to_poll,
-                        wait_config=command.wait_config,
+                        wait_config=wait_config,
                     )
                 else:
                     self.module.fail_json(
@@ -177,11 +487,20 @@ class BaseRunner:
         self.exit(commands=[cmd.serialize_request() for cmd in plan])
 
     def send_request(
-        self, method, path, data=None, query_params=None, path_params=None
+        self,
+        method,
+        path,
+        data=None,
+        query_params=None,
+        path_params=None,
+        allow_transient_errors=False,
+        timeout=None,
+        use_cache=True,
     ) -> tuple[any, int]:
         """
-        A robust, centralized wrapper around Ansible's `fetch_url` utility to
-        handle all API requests to the Waldur backend.
+        A robust, centralized wrapper around the HTTP transport (a pooled
+        session, or Ansible's `fetch_url` utility) to handle all API requests
+        to the Waldur backend.
 
         This method is the single point of entry for all network communication
         in any generated module. It is responsible for:
@@ -208,6 +527,15 @@ class BaseRunner:
             data (dict, optional): The request body payload. Defaults to None.
             query_params (dict, optional): A dictionary of query parameters. Defaults to None.
             path_params (dict, optional): Parameters to format into the path for nested endpoints. Defaults to None.
+            allow_transient_errors (bool, optional): If True, connection-level
+                failures and 5xx responses are returned to the caller as
+                `(None, status_code)` instead of failing the module, so that
+                callers such as pollers can retry them. Defaults to False.
+            timeout (float, optional): The request timeout in seconds. Defaults
+                to REQUEST_TIMEOUT.
+            use_cache (bool, optional): If False, a GET always goes to the API
+                instead of being answered from the runner's response cache, as
+                pollers require. Defaults to True.
 
         Returns:
             A tuple containing the parsed JSON response (or None for '204 No Content')
@@ -222,7 +550,7 @@ class BaseRunner:
                 path = path.format(**path_params)
             except KeyError as e:
                 # Fail early if a required placeholder is missing from the provided parameters.
-                self.module.fail_json(
+                self.fail_json(
                     msg=f"Internal configuration error: Missing required path parameter in API call: {e}"
                 )
                 return None, 0  # Unreachable
@@ -233,56 +561,52 @@ class BaseRunner:
         if path.startswith("http://") or path.startswith("https://"):
             url = path
         else:
-            api_url_base = self.module.params["api_url"].rstrip("/")
-            path_relative = path.lstrip("/")
-            url = f"{api_url_base}/{path_relative}"
+            url = f"{self.api_url}/{path.lstrip('/')}"
 
         # Safely encode and append query parameters to the URL. This handles special
         # characters and correctly formats list values as repeated parameters (e.g., ?key=v1&key=v2).
         if query_params:
-            encoded_params = []
-            for key, value in query_params.items():
-                if isinstance(value, list):
-                    for v_item in value:
-                        encoded_params.append((key, v_item))
-                else:
-                    encoded_params.append((key, value))
-            url += "?" + urlencode(encoded_params)
+            url += "?" + urlencode(query_params, doseq=True)
 
         # --- Step 2: Prepare Request Body and Headers ---
 
-        # If a data payload is provided, serialize it to a JSON string. Ansible's `fetch_url`
+        # If a data payload is provided, serialize it to JSON. Ansible's `fetch_url`
         # requires the `data` argument to be a byte string for POST/PUT/PATCH requests.
-        if data and not isinstance(data, str):
-            data = self.module.jsonify(data)
-
-        # Define the standard headers for all API requests.
-        headers = {
-            "Authorization": f"token {self.module.params['access_token']}",
-            "Content-Type": "application/json",
-        }
+        if data and not isinstance(data, (str, bytes)):
+            data = _json_dumps(data)
 
         # --- Step 3: Execute the API Request ---
 
-        # Call Ansible's built-in `fetch_url` utility to perform the HTTP request.
-        # This is the only place in the codebase that makes a network call.
-        response, info = fetch_url(
-            self.module,
-            url,
-            data=data,
-            headers=headers,
-            method=method,
-            timeout=30,  # A sensible default timeout to prevent hung tasks.
-        )
+        # Within a run, a GET of a URL that was already fetched successfully is
+        # answered from memory until the next request that changes something.
+        # The raw body is kept, so every caller still parses its own copy.
+        cacheable = method == "GET" and use_cache
+        cached = self._get_cache.get(url) if cacheable else None
+        if cached is not None:
+            body_content, info = cached
+        else:
+            if method != "GET":
+                self._get_cache.clear()
+            # This is the only place in the codebase that makes a network call.
+            body_content, info = self._perform_request(
+                method, url, data, self._headers, timeout or REQUEST_TIMEOUT
+            )
+            if cacheable and 200 <= info["status"] < 300:
+                self._get_cache[url] = (body_content, info)
 
         # --- Step 4: Process the Response ---
 
         # Retain the response metadata (status + headers) so callers can inspect
         # pagination headers (e.g. 'Link') after the request returns.
-        self._last_response_info = info
+        self._local.last_response_info = info
 
         status_code = info["status"]
 
+        # Let the caller retry transient failures (connection errors, 5xx) if it
+        # has opted in to handling them itself.
+        if allow_transient_errors and (status_code < 0 or status_code >= 500):
+            return None, status_code
+
         # Handle connection-level failures that never produced an HTTP response.
         # `fetch_url` signals these (DNS failure, connection refused, timeout,
         # dropped VPN, etc.) by returning `response=None` and a synthetic status
@@ -292,7 +616,7 @@ class BaseRunner:
         # error as a legitimate "zero results found" outcome, which is both
         # misleading and dangerous for callers that act on the emptiness.
         if status_code < 0:
-            self.module.fail_json(
+            self.fail_json(
                 msg=(
                     f"Request to {url} failed: no response received from the server. "
                     f"Details: {info.get('msg', 'Unknown connection error.')}"
@@ -302,6 +626,11 @@ class BaseRunner:
 
         # Handle non-successful status codes (e.g., 400, 403, 404, 500).
         if status_code >= 400:
+            # The request may have used an object resolved from the process-wide
+            # cache by an earlier task that has since been renamed or removed
+            # (404, or a 400/409 about a stale reference); later tasks must look
+            # it up again.
+            clear_shared_lookups()
             # As per the `fetch_url` contract, the error response body is located in `info['body']`.
             error_body = info.get("body", b"")
             error_json = None
@@ -311,35 +640,40 @@ class BaseRunner:
                 try:
                     # Attempt to parse the error body as JSON, as this is the standard
                     # format for detailed errors from the Waldur API.
-                    error_json = json.loads(error_body)
-                    # Create a pretty-printed string version for the main error message.
-                    error_details_str = (
-                        f"API Response: {json.dumps(error_json, indent=2)}"
-                    )
-                except json.JSONDecodeError:
+                    error_json = _json_loads(error_body)
+                    # The structured error is also returned as `api_error`, so the
+                    # message carries a compact copy. It is only pretty-printed when
+                    # the task runs with increased verbosity (-vv or more), as error
+                    # bodies can be several kilobytes long.
+                    if (
+                        getattr(self.module, "_verbosity", 0) >= 2
+                        and len(error_body) <= PRETTY_ERROR_BODY_BYTES
+                    ):
+                        error_text = json.dumps(error_json, indent=2)
+                    else:
+                        error_text = _json_dumps(error_json).decode()
+                    error_details_str = f"API Response: {error_text}"
+                except ValueError:
                     # If the body is not JSON, fall back to a raw string representation.
+                    # `ValueError` also covers bodies that are not valid UTF-8 (e.g.
+                    # a multi-byte character cut off by the size cap).
                     error_details_str = (
                         f"API Response (raw): {error_body.decode(errors='ignore')}"
                     )
 
             # Construct a comprehensive, user-friendly error message.
+            payload = data.decode(errors="ignore") if isinstance(data, bytes) else data
             msg = (
                 f"Request to {url} failed. Status: {status_code}. "
-                f"Message: {info['msg']}. {error_details_str}. Payload: {data}"
+                f"Message: {info['msg']}. {error_details_str}. Payload: {payload}"
             )
 
             # Fail the Ansible module, providing both the comprehensive message and the
             # structured JSON error for easier parsing and debugging in playbooks.
-            self.module.fail_json(msg=msg, api_error=error_json)
+            self.fail_json(msg=msg, api_error=error_json)
             return error_json, status_code  # Unreachable
 
         # Handle successful responses.
-        body_content = None
-        if response:
-            # For successful requests, the response body is a file-like object
-            # that must be read.
-            body_content = response.read()
-
         # Handle '204 No Content' - a successful request with an intentionally empty body.
         if status_code == 204 or not body_content:
             # For GET requests, an empty response should be an empty list to prevent
@@ -350,17 +684,103 @@ class BaseRunner:
 
         # Attempt to parse the successful response body as JSON.
         try:
-            return json.loads(body_content), status_code
-        except json.JSONDecodeError:
+            return _json_loads(body_content), status_code
+        except ValueError:
             # This is an exceptional case: the API returned a success status (2xx)
             # but the response body was not valid JSON, indicating a potential API bug
             # or proxy issue.
-            self.module.fail_json(
+            self.fail_json(
                 msg=f"API returned a success status ({status_code}) but the response was not valid JSON.",
                 response_body=body_content.decode(errors="ignore"),
             )
             return None, status_code  # Unreachable
 
+    def _perform_request(
+        self, method: str, url: str, data, headers: dict, timeout: float
+    ) -> tuple:
+        """
+        Performs a single HTTP request and returns the raw response.
+
+        By default, Ansible's `fetch_url` is used, which opens a new connection
+        per request. When the pooled session has been enabled, the request goes
+        through it so the underlying connection is kept alive and reused by
+        subsequent calls.
+
+        Both code paths return the `info` dictionary in the shape and with the
+        messages produced by `fetch_url`: the integer 'status' (-1 for
+        connection-level failures), a human-readable 'msg', the error body under
+        'body' for 4xx/5xx responses, and the response headers with lowercased
+        keys.
+
+        Returns:
+            A tuple of the response body as bytes (empty when there is none)
+            and the `info` dictionary.
+        """
+        if self._session is None:
+            response, info = fetch_url(
+                self.module,
+                url,
+                data=data,
+                headers=headers,
+                method=method,
+                timeout=timeout,  # Prevents hung tasks.
+            )
+            # For successful requests, the response body is a file-like object
+            # that must be read.
+            if not response:
+                return b"", info
+            # The response is closed as soon as its body has been read, rather
+            # than whenever it is garbage collected, so its socket is released
+            # right away.
+            try:
+                return response.read(), info
+            finally:
+                response.close()
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            # The body is streamed so that the size of an error body can be capped
+            # while reading. Leaving the `with` block releases the connection back to the pool.
+            with self._session.request(
+                method,
+                url,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+                verify=self._verify,
+                stream=True,
+            ) as response:
+                if response.status_code >= 400:
+                    body = self._read_error_body(response.iter_content(READ_CHUNK_SIZE))
+                else:
+                    body = response.content
+        except requests.RequestException as e:
+            return b"", {"status": -1, "msg": f"Request failed: {e}", "url": url}
+
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info.update(status=response.status_code, url=url)
+        if response.status_code >= 400:
+            info["msg"] = f"HTTP Error {response.status_code}: {response.reason}"
+            info["body"] = body
+        else:
+            info["msg"] = f"OK ({info.get('content-length', 'unknown')} bytes)"
+        return body, info
+
+    @staticmethod
+    def _read_error_body(chunks) -> bytes:
+        """
+        Accumulates at most `MAX_ERROR_BODY_BYTES` of an error response body
+        from an iterator of byte chunks. The rest of the body is never read.
+        """
+        body = bytearray()
+        for chunk in chunks:
+            body += chunk
+            if len(body) >= MAX_ERROR_BODY_BYTES:
+                del body[MAX_ERROR_BODY_BYTES:]
+                break
+        return bytes(body)
+
     def _get_next_page_url(self) -> Optional[str]:
         """
         Extracts the 'next' page URL from the most recent response's 'Link' header.
@@ -374,7 +794,7 @@ class BaseRunner:
             The absolute URL for the next page, or None when the current page is
             the last one (or no 'Link' header is present).
         """
-        info = self._last_response_info or {}
+        info = getattr(self._local, "last_response_info", None) or {}
         # `fetch_url` lowercases response header keys, but fall back to the
         # canonical casing just in case.
         link_header = info.get("link") or info.get("Link")
@@ -436,15 +856,94 @@ class BaseRunner:
 
         return all_results
 
-    def _is_uuid(self, val):
+    def _run_concurrently(self, calls: list) -> list:
+        """
+        Runs independent, I/O-bound callables concurrently and returns their
+        results in the order the callables were given.
+
+        Resolver lookups are dominated by network round-trips, so overlapping
+        them reduces the wall-clock cost from the sum of the individual latencies
+        to roughly the slowest one.
+
+        A failure reported by a worker through `fail_json` is deferred and
+        replayed from the calling thread once all workers have finished. This
+        guarantees that the module emits exactly one result document, and that
+        the reported failure is the first one in submission order, just as in a
+        sequential run.
+
+        A call made from within a worker runs its callables sequentially, so
+        nested lookups never start a second pool and the number of requests in
+        flight stays within `MAX_CONCURRENT_REQUESTS`, the size of the session's
+        connection pool.
+
+        Args:
+            calls: A list of zero-argument callables.
+
+        Returns:
+            A list with the return value of each callable.
+        """
+        if len(calls) < 2 or getattr(self._local, "in_worker", False):
+            return [call() for call in calls]
+
+        # Imported on first use: runs that never issue concurrent lookups do not
+        # pay for loading `concurrent.futures` and its dependencies.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_REQUESTS, len(calls))
+        ) as executor:
+            futures = [executor.submit(self._run_in_worker, call) for call in calls]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except _DeferredFailure as failure:
+                self.module.fail_json(**failure.kwargs)
+        return results
+
+    def _run_in_worker(self, call):
         """
-        Checks if a value is a UUID.
+        Runs a callable in a worker thread of `_run_concurrently`, marking the
+        thread so that `fail_json` defers failures and nested calls to
+        `_run_concurrently` run sequentially.
         """
+        self._local.in_worker = True
         try:
-            uuid.UUID(str(val))
-            return True
-        except (ValueError, TypeError, AttributeError):
-            return False
+            return call()
+        finally:
+            self._local.in_worker = False
+
+    # Kept as a method so that runners and their subclasses can call it as before.
+    _is_uuid = staticmethod(is_uuid)
+
+    @staticmethod
+    def _uuid_from_url(url: str) -> str:
+        """
+        Returns the last path segment of an API URL, which for Waldur resource
+        URLs is the resource UUID (e.g. '.../api/projects/<uuid>/' -> '<uuid>').
+        Query strings and fragments are ignored. A bare UUID is returned as is.
+        """
+        return urlsplit(url).path.rstrip("/").rpartition("/")[2]
+
+    def _local_uuid(self, value) -> Optional[str]:
+        """
+        Extracts a UUID from a user-provided identifier without any API call.
+
+        Args:
+            value: A name, UUID or full API URL.
+
+        Returns:
+            The UUID when `value` is a UUID or an API URL ending in one,
+            otherwise None (i.e. the value is a name that must be looked up).
+        """
+        if self._is_uuid(value):
+            return value
+        if isinstance(value, str) and value.startswith(("http://", "https://")):
+            candidate = self._uuid_from_url(value)
+            if self._is_uuid(candidate):
+                return candidate
+        return None
 
     def _wait_for_completion(
         self, polling_path: str, resource_uuid: str, wait_config: dict
@@ -453,17 +952,33 @@ class BaseRunner:
         A generic poller for an asynchronous task until it reaches a stable state.
         This is used for both marketplace orders and long-running resource actions.
         """
-        ok_states = wait_config.get("ok_states", ["OK"])
-        erred_states = wait_config.get("erred_states", ["Erred"])
+        # The states are checked on every poll; sets make each check O(1).
+        ok_states = frozenset(wait_config.get("ok_states", ["OK"]))
+        erred_states = frozenset(wait_config.get("erred_states", ["Erred"]))
         state_field = wait_config.get("state_field", "state")
+        initial_delay = wait_config.get("initial_interval", POLL_INITIAL_DELAY)
+        backoff_rate = wait_config.get("backoff_rate", POLL_BACKOFF_RATE)
 
         timeout = self.module.params.get("timeout", 600)
         interval = self.module.params.get("interval", 20)
         start_time = time.time()
+        deadline = start_time + timeout
+        attempt = 0
+
+        # Every poll requests the same URL, so it is built once here. Being
+        # absolute, it is used by `send_request` as is.
+        polling_url = (
+            f"{self.api_url}/{polling_path.format(uuid=resource_uuid).lstrip('/')}"
+        )
 
-        while time.time() - start_time < timeout:
+        while time.time() < deadline:
+            # A poll never waits on the API beyond the overall deadline.
             polled_data, status_code = self.send_request(
-                "GET", polling_path, path_params={"uuid": resource_uuid}
+                "GET",
+                polling_url,
+                allow_transient_errors=True,
+                timeout=max(1.0, min(REQUEST_TIMEOUT, deadline - time.time())),
+                use_cache=False,
             )
 
             if status_code == 404:
@@ -489,7 +1004,13 @@ class BaseRunner:
                     )
                     return  # Unreachable
 
-            time.sleep(interval)
+            # The task is still running, or the API had a transient failure (a
+            # connection error or a 5xx response); either way, back off and poll
+            # again. Never sleep past the deadline.
+            cap = min(interval, initial_delay * backoff_rate ** min(attempt, 32))
+            delay = random.uniform(0, cap)
+            time.sleep(max(0, min(delay, deadline - time.time())))
+            attempt += 1
 
         self.module.fail_json(
             msg=f"Timeout waiting for task on resource {resource_uuid} to complete."
@@ -516,7 +1037,8 @@ class BaseRunner:
 
         -   **Mode A (Complex Object Normalization):** When dealing with a list of dictionaries
             (e.g., port configurations) and guided by `idempotency_keys`, it transforms each
-            dictionary into a canonical, sorted JSON string. These strings are then put into
+            dictionary into a canonical form: a tuple of its identity values, or a sorted JSON
+            string when those values are not hashable. These forms are then put into
             a set, creating a truly order-insensitive and comparable representation of the
             list's "identity."
 
@@ -566,6 +1088,11 @@ class BaseRunner:
             # We have the necessary `idempotency_keys` to guide the normalization of
             # otherwise un-comparable dictionaries.
 
+            # The identity keys are the same for every item, so they are put in a
+            # fixed order once, outside the loop, each paired with its schema
+            # default (None when the schema has none).
+            keys_to_use = tuple(sorted(idempotency_keys))
+            key_defaults = tuple((key, defaults_map.get(key)) for key in keys_to_use)
             canonical_forms = set()
             for item in value:
                 # Robustness check: If the list is mixed with non-dictionary items,
@@ -575,27 +1102,31 @@ class BaseRunner:
                 if not isinstance(item, dict):
                     return value
 
-                # Apply schema defaults if a schema is available.
-                # We apply this to every item to handle both user input and resource state consistently.
-                item_to_process = self._apply_defaults(item, defaults_map)
-
-                # This is the core of the complex normalization. We create a new, temporary
-                # dictionary containing ONLY the keys that define the object's identity.
+                # This is the core of the complex normalization. We keep ONLY the values
+                # of the keys that define the object's identity, in the fixed key order.
                 # This ensures we ignore transient or server-generated fields (like 'uuid'
                 # or 'status') when comparing the user's desired state to the current state.
-                keys_to_use = idempotency_keys or list(item_to_process.keys())
-                filtered_item = {key: item_to_process.get(key) for key in keys_to_use}
-
-                # We now convert this filtered dictionary into a canonical string. This string
-                # is both hashable (so it can be added to a set) and deterministic.
-                #   - `sort_keys=True`: Guarantees that `{'a': 1, 'b': 2}` and `{'b': 2, 'a': 1}`
-                #     produce the exact same string. This is essential.
-                #   - `separators=(",", ":")`: Creates the most compact JSON representation,
-                #     removing any variations in whitespace.
-                canonical_string = json.dumps(
-                    filtered_item, sort_keys=True, separators=(",", ":")
+                # A key missing from the item takes its schema default. We apply this to
+                # every item to handle both user input and resource state consistently.
+                # When all of these values are hashable (strings, numbers, None), the
+                # tuple itself is the canonical form.
+                canonical_form = tuple(
+                    item.get(key, default) for key, default in key_defaults
                 )
-                canonical_forms.add(canonical_string)
+                try:
+                    hash(canonical_form)
+                except TypeError:
+                    # Some identity value is itself a list or a dict (e.g. 'fixed_ips').
+                    # The filtered item is then converted into a canonical string, which
+                    # is both hashable (so it can be added to a set) and deterministic.
+                    #   - `sort_keys=True`: Guarantees that `{'a': 1, 'b': 2}` and `{'b': 2, 'a': 1}`
+                    #     produce the exact same string. This is essential.
+                    #   - `separators=(",", ":")`: Creates the most compact JSON representation,
+                    #     removing any variations in whitespace.
+                    canonical_form = _canonical_json(
+                        dict(zip(keys_to_use, canonical_form))
+                    )
+                canonical_forms.add(canonical_form)
 
             return canonical_forms
         else:
@@ -637,6 +1168,7 @@ class BaseRunner:
             containing the parameter name, the old value, and the new value. This
             structure is essential for providing clear, predictive diffs to the user.
         4.  **Aggregate Changes**: Collect all detected changes into a list.
+            Steps 1-4 are performed by `_diff_update_fields`.
         5.  **Command Generation**: If—and only if—the list of changes is non-empty,
             instantiate and return a single `UpdateCommand` containing all the
             changes. This ensures no command is generated (and thus no API call is made)
@@ -661,35 +1193,7 @@ class BaseRunner:
             return []
 
         # --- Step 2: Detect Changes and Build the Diff List ---
-
-        # This list will store a structured record of every detected change.
-        # This is the data that will be used for both the API payload and the user-facing diff.
-        changes = []
-
-        # Iterate through each field that the module configuration has marked as updatable.
-        for field in update_fields:
-            # Get the value for this field from the user's Ansible playbook parameters.
-            new_value = self.module.params.get(field)
-
-            # --- 2a. RESOLVE Desired State ---
-            # Delegate to the ParameterResolver to convert the user's input (e.g., `['sg-web']`)
-            # into the final, API-ready data structure (e.g., `[{'url': '...'}]`).
-            # The `resolve_output_format` hint is crucial for context-dependent formatting.
-            if new_value is not None:
-                new_value = self.resolver.resolve(field, new_value)
-
-            # Get the current value for this field from the existing resource data.
-            old_value = self.resource.get(field)
-
-            # The core idempotency check. A change is registered only if:
-            #   a) The user has actually provided a value for it (`new_value is not None`).
-            #      This is critical to prevent the module from trying to set a field to `null`
-            #      just because the user omitted it from their playbook.
-            #   b) The user-provided value is different from the value currently on the
-            #      resource in Waldur. This handles all simple types (str, int, bool, etc.).
-            if new_value is not None and new_value != old_value:
-                # A change has been detected. Record it in our structured list.
-                changes.append({"param": field, "old": old_value, "new": new_value})
+        changes = self._diff_update_fields(update_fields)
 
         # --- Step 3: Generate the Command ---
 
@@ -717,6 +1221,57 @@ class BaseRunner:
         # Return an empty list to signify that no `UpdateCommand` is necessary.
         return []
 
+    def _diff_update_fields(self, update_fields: list) -> list:
+        """
+        Compares the user-provided values of the given updatable fields with the
+        current state of the resource in a single pass.
+
+        This is the one place where simple attribute changes are detected. The
+        resulting list drives both the PATCH payload and the predictive diff
+        shown in check mode, so the fields are never walked twice.
+
+        Args:
+            update_fields: The Ansible parameter names that are mutable.
+
+        Returns:
+            A list of `{"param": ..., "old": ..., "new": ...}` dictionaries, one
+            per field whose desired value differs from the current one.
+        """
+        # Only the fields the user has actually provided take part in the comparison.
+        # Omitted fields (`None`) must never be sent, as that would set them to
+        # `null` on the resource. Filtering them up front, with the parameter and
+        # resource lookups hoisted out of the loop, keeps the comparison to the
+        # fields that matter.
+        params = self.module.params
+        resource = self.resource or {}
+        provided = {
+            field: value
+            for field in update_fields
+            if (value := params.get(field)) is not None
+        }
+
+        # Delegate to the ParameterResolver to convert the user's input (e.g., `['sg-web']`)
+        # into the final, API-ready data structure (e.g., `[{'url': '...'}]`). All
+        # provided fields are resolved in one batch, so their lookups run concurrently.
+        resolved = self.resolver.resolve_many(provided)
+
+        # This list will store a structured record of every detected change.
+        # This is the data that will be used for both the API payload and the user-facing diff.
+        changes = []
+
+        for field, new_value in resolved.items():
+            # Get the current value for this field from the existing resource data.
+            old_value = resource.get(field)
+
+            # The core idempotency check. A change is registered only if the
+            # user-provided value is different from the value currently on the
+            # resource in Waldur. This handles all simple types (str, int, bool, etc.).
+            if new_value is not None and new_value != old_value:
+                # A change has been detected. Record it in our structured list.
+                changes.append({"param": field, "old": old_value, "new": new_value})
+
+        return changes
+
     def _build_action_update_commands(self, resolve_output_format="create") -> list:
         """
         Analyzes complex, action-based changes and returns a list of ActionCommands,
@@ -759,31 +1314,39 @@ class BaseRunner:
         # This list will hold all the `ActionCommand` objects we decide to create.
         commands = []
 
-        # --- Step 2: Main Loop - Plan Each Action ---
+        # --- Step 2: RESOLVE Desired States ---
+        # An action is only planned if the user has provided its corresponding parameter.
+        # Apply transformation to the user's input before resolution and comparison.
+        # Wrap the values in a temporary dict to use the helper.
+        provided_values = {
+            action_info["param"]: value
+            for action_info in update_actions.values()
+            if (value := self.module.params.get(action_info["param"])) is not None
+        }
+        transformed_values = self._apply_transformations(provided_values)
+
+        # Delegate to the ParameterResolver to convert the user's input (e.g., `['sg-web']`)
+        # into the final, API-ready data structure (e.g., `[{'url': '...'}]`).
+        # The parameters of all actions are resolved in one batch, so the lookups
+        # of independent actions (e.g. security groups and ports) run concurrently
+        # instead of one action after another.
+        # The `resolve_output_format` hint is crucial for context-dependent formatting.
+        resolved_values = self.resolver.resolve_many(
+            transformed_values, output_format=resolve_output_format
+        )
+
+        # --- Step 3: Main Loop - Plan Each Action ---
 
         # Iterate through each action defined in the user's generator configuration.
         for _, action_info in update_actions.items():
             param_name = action_info["param"]
             param_value = self.module.params.get(param_name)
 
-            # An action is only planned if the user has provided its corresponding parameter.
             # If the parameter is `None`, we skip this action entirely.
             if param_value is not None:
-                # Apply transformation to the user's input before resolution and comparison.
-                # Wrap the single value in a temporary dict to use the helper.
-                temp_payload = {param_name: param_value}
-                transformed_payload_dict = self._apply_transformations(temp_payload)
-                transformed_value = transformed_payload_dict[param_name]
-
-                # --- 2a. RESOLVE Desired State ---
-                # Delegate to the ParameterResolver to convert the user's input (e.g., `['sg-web']`)
-                # into the final, API-ready data structure (e.g., `[{'url': '...'}]`).
-                # The `resolve_output_format` hint is crucial for context-dependent formatting.
-                resolved_payload = self.resolver.resolve(
-                    param_name, transformed_value, output_format=resolve_output_format
-                )
+                resolved_payload = resolved_values[param_name]
 
-                # --- 2b. NORMALIZE Current and Desired States ---
+                # --- 3a. NORMALIZE Current and Desired States ---
                 # Get the current value from the existing resource.
                 compare_key = action_info.get("compare_key", param_name)
                 resource_value = self.resource.get(compare_key)
@@ -819,6 +1382,13 @@ class BaseRunner:
                         # The original resource_value is replaced with the filtered one for comparison.
                         resource_value = temp_filtered_list
 
+                # A desired value that is literally equal to the current one can only
+                # normalize to the same form, so the per-item normalization below
+                # is skipped. Unequal values still go through it, since lists that
+                # differ in order, length (duplicates) or defaults may be equivalent.
+                if resolved_payload == resource_value:
+                    continue
+
                 # Get the list of keys that define an object's identity for normalization.
                 idempotency_keys = action_info.get("idempotency_keys", [])
 
@@ -864,10 +1434,10 @@ class BaseRunner:
                     resolved_payload, idempotency_keys, defaults_map
                 )
 
-                # --- 2c. DETECT Change ---
+                # --- 3b. DETECT Change ---
                 # The actual idempotency check: a simple, reliable comparison of the two normalized values.
                 if normalized_new != normalized_old:
-                    # --- 2d. GENERATE Command ---
+                    # --- 3c. GENERATE Command ---
                     # A change was detected. We must create an `ActionCommand` for it.
 
                     # **CRITICAL EDGE CASE**: Handle API payload wrapping.
@@ -906,7 +1476,7 @@ class BaseRunner:
                         )
                     )
 
-        # --- Step 3: Return the Plan ---
+        # --- Step 4: Return the Plan ---
         # Return the list of generated commands. This list will be empty if no
         # actions needed to be triggered.
         return commands
@@ -954,11 +1524,12 @@ class BaseRunner:
         """
         # --- Step 1: Gather configuration from the context ---
         check_url = self.context["check_url"]
+        params = self.module.params
 
         # --- Step 2: Determine the identifier and build query parameters ---
 
         # Priority 1: Check if a UUID is provided. This allows for precise, direct lookup.
-        resource_uuid = self.module.params.get("uuid")
+        resource_uuid = params.get("uuid")
         if resource_uuid:
             # Direct lookup by UUID is the most reliable method.
             path = f"{check_url.rstrip('/')}/{resource_uuid}/"
@@ -978,38 +1549,32 @@ class BaseRunner:
             # New composite key logic.
             # We iterate over the explicitly defined composite keys.
             for key in composite_keys:
-                value = self.module.params.get(key)
-                if value is None:
+                if params.get(key) is None:
                     self.module.fail_json(
                         msg=f"Missing required parameter for composite key: '{key}'."
                     )
 
+            # Foreign keys (those with a resolver) are resolved to UUIDs together,
+            # so that independent lookups are issued concurrently.
+            resolved_uuids = self._resolve_filter_uuids(
+                {key: params[key] for key in composite_keys if key in resolver_order}
+            )
+
+            for key in composite_keys:
                 # Determine the API query parameter name.
                 # If mapped in check_filter_keys, use that. Otherwise, default to the key itself.
                 query_param_name = filter_keys_map.get(key, key)
 
-                # Check if this key needs resolution (is it a foreign key?).
                 if key in resolver_order:
-                    # Use the resolver to get the full object and extract the UUID.
-                    resolved_object = self.resolver.resolve(key, value)
-                    if resolved_object:
-                        if isinstance(resolved_object, str):
-                            resolved_uuid = resolved_object.strip("/").split("/")[-1]
-                        else:
-                            resolved_uuid = resolved_object.get("uuid")
-
-                        if not resolved_uuid:
-                            self.module.fail_json(
-                                msg=f"Could not extract UUID from resolved '{key}' object."
-                            )
-                        query_params[query_param_name] = resolved_uuid
+                    if key in resolved_uuids:
+                        query_params[query_param_name] = resolved_uuids[key]
                 else:
                     # Simple value (string, int), use directly.
-                    query_params[query_param_name] = value
+                    query_params[query_param_name] = params[key]
 
         else:
             # Legacy logic: Fall back to name-based lookup or filter-based lookup.
-            identifier_value = self.module.params.get("name")
+            identifier_value = params.get("name")
             name_query_param = self.context.get("name_query_param", "name_exact")
 
             if identifier_value:
@@ -1024,30 +1589,18 @@ class BaseRunner:
                 # Otherwise, treat it as a standard name-based search filter.
                 query_params[name_query_param] = identifier_value
 
-            # Iterate through the resolvers in the topologically sorted order.
-            for param_name in resolver_order:
-                # We only process resolvers that are configured as context filters.
-                if param_name in filter_keys_map and self.module.params.get(param_name):
-                    # Use the main `resolve` method. It is dependency-aware and populates
-                    # the resolver's cache with the full object, which is essential for
-                    # the next resolver in the chain.
-                    resolved_object = self.resolver.resolve(
-                        param_name, self.module.params[param_name]
-                    )
-
-                    if resolved_object:
-                        # The `resolve` method returns the full object. We need its UUID.
-                        if isinstance(resolved_object, str):
-                            resolved_uuid = resolved_object.strip("/").split("/")[-1]
-                        else:
-                            resolved_uuid = resolved_object.get("uuid")
-                        if not resolved_uuid:
-                            self.module.fail_json(
-                                msg=f"Could not extract UUID from resolved '{param_name}' object."
-                            )
-
-                        filter_key = filter_keys_map[param_name]
-                        query_params[filter_key] = resolved_uuid
+            # Collect the resolvers that are configured as context filters and that
+            # the user actually provided, in the topologically sorted order, and
+            # resolve them to UUIDs in one go.
+            resolved_uuids = self._resolve_filter_uuids(
+                {
+                    param_name: params[param_name]
+                    for param_name in resolver_order
+                    if param_name in filter_keys_map and params.get(param_name)
+                }
+            )
+            for param_name, resolved_uuid in resolved_uuids.items():
+                query_params[filter_keys_map[param_name]] = resolved_uuid
 
             # Validation: If we have neither a name nor any context filters, we cannot
             # perform a safe existence check.
@@ -1084,22 +1637,48 @@ class BaseRunner:
         else:
             self.resource = data if isinstance(data, dict) else None
 
-    def _apply_defaults(self, item: dict, defaults_map: dict) -> dict:
+    def _resolve_filter_uuids(self, values: dict) -> dict:
         """
-        Normalizes a single dictionary item by applying default values for any
-        keys that are missing from the item.
+        Resolves the values of existence-check filters to the UUIDs the API
+        filters by.
+
+        A UUID or API URL already carries the identifier, so no object is
+        fetched for it; resolvers that depend on such a parameter will still
+        fetch it on demand. The remaining values are resolved together through
+        `ParameterResolver.resolve_many`, which issues independent lookups
+        concurrently while honouring the dependencies between them and
+        populating the resolver's cache for the next resolver in the chain.
+
+        Args:
+            values: A mapping of parameter names to user-provided identifiers.
+
+        Returns:
+            A mapping of parameter names to UUIDs, in the input order. Values
+            that resolve to nothing are left out.
         """
-        # Start with a copy to avoid modifying the original object.
-        normalized_item = item.copy()
-
-        # If no defaults are configured, return immediately.
-        if not defaults_map:
-            return normalized_item
-
-        # Iterate through the pre-processed defaults map.
-        for key, default_value in defaults_map.items():
-            # If a key is missing from the item...
-            if key not in normalized_item:
-                # ...add it with its default value.
-                normalized_item[key] = default_value
-        return normalized_item
+        local_uuids = {name: self._local_uuid(value) for name, value in values.items()}
+        resolved = self.resolver.resolve_many(
+            {name: value for name, value in values.items() if not local_uuids[name]}
+        )
+
+        uuids = {}
+        for name in values:
+            if local_uuids[name]:
+                uuids[name] = local_uuids[name]
+                continue
+
+            resolved_object = resolved[name]
+            if not resolved_object:
+                continue
+
+            # The `resolve` method returns a URL or the full object. We need its UUID.
+            if isinstance(resolved_object, str):
+                resolved_uuid = self._uuid_from_url(resolved_object)
+            else:
+                resolved_uuid = resolved_object.get("uuid")
+            if not resolved_uuid:
+                self.module.fail_json(
+                    msg=f"Could not extract UUID from resolved '{name}' object."
+                )
+            uuids[name] = resolved_uuid
+        return uuids
@@ -14,7 +14,11 @@ class LinkRunner(BaseRunner):
 
     def __init__(self, module, context):
         super().__init__(module, context)
-        self.resolver = ParameterResolver(self)
+        # The source and target objects are read from the resolver's cache.
+        self.resolver = ParameterResolver(
+            self,
+            object_params=(context["source"]["param"], context["target"]["param"]),
+        )
         self.source_object = None
         self.target_object = None
         self.is_linked = False
@@ -28,13 +32,17 @@ class LinkRunner(BaseRunner):
         resolver_order = self.context.get("resolver_order", [])
 
         # 1. Resolve all parameters in the correct dependency order.
-        # This populates the resolver's cache for subsequent lookups.
-        for param_name in resolver_order:
-            if (
-                param_name in self.module.params
-                and self.module.params[param_name] is not None
-            ):
-                self.resolver.resolve(param_name, self.module.params[param_name])
+        # This populates the resolver's cache for subsequent lookups. The resolver
+        # orders them by their filters and runs independent lookups (e.g. the
+        # source and the target) concurrently.
+        params = self.module.params
+        self.resolver.resolve_many(
+            {
+                param_name: params[param_name]
+                for param_name in resolver_order
+                if params.get(param_name) is not None
+            }
+        )
 
         # 2. Retrieve the fully resolved source and target objects from the cache.
         source_param = self.context["source"]["param"]
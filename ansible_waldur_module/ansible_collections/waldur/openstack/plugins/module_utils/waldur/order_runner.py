@@ -34,6 +34,9 @@ class OrderRunner(BaseRunner):
         super().__init__(module, context)
         # This will store the marketplace order object after a successful creation.
         self.order = None
+        # URLs of the context parameters (offering, project) identified while
+        # checking for an existing resource, reused when planning the order.
+        self._resolved_urls = {}
         # Instantiate the powerful, centralized resolver for handling all
         # parameter-to-URL conversions.
         self.resolver = ParameterResolver(self)
@@ -42,10 +45,11 @@ class OrderRunner(BaseRunner):
         """
         Check for resource existence, prioritizing the offering-based filter if present.
         """
+        params = self.module.params
         # If 'offering' is specified, we must filter by it.
         # This prevents identical resource names in different offerings from
         # being treated as the same resource.
-        if self.module.params.get("offering"):
+        if params.get("offering"):
             marketplace_url = self.context.get("marketplace_resource_check_url")
             if not marketplace_url:
                 # Should not happen if plugin is configured correctly
@@ -54,28 +58,30 @@ class OrderRunner(BaseRunner):
                 )
                 return
 
-            # Resolve the offering to get its UUID
-            offering_uuid = self.resolver.resolve(
-                "offering", self.module.params["offering"]
-            )
+            # Resolve the offering and the project to their UUIDs. A UUID or URL is
+            # used as is, without fetching the object; names are looked up
+            # concurrently.
+            context_values = {"offering": params["offering"]}
+            if params.get("project"):
+                context_values["project"] = params["project"]
+            resolved_uuids = self._resolve_filter_uuids(context_values)
+
+            offering_uuid = resolved_uuids.get("offering")
             if not offering_uuid:
                 self.module.fail_json(
-                    msg=f"Could not resolve offering '{self.module.params['offering']}' to a valid UUID string."
+                    msg=f"Could not resolve offering '{params['offering']}' to a valid UUID string."
                 )
                 return
+            # Building the URL from a UUID does not require an API call.
+            self._resolved_urls["offering"] = self.resolver.resolve_to_url(
+                "offering", offering_uuid
+            )
 
-            # The resolver returns a URL, extract the UUID
-            if "/" in offering_uuid:
-                offering_uuid = offering_uuid.rstrip("/").split("/")[-1]
-
-            # Resolve project to get its UUID for filtering
-            project_uuid = None
-            if self.module.params.get("project"):
-                project_url = self.resolver.resolve(
-                    "project", self.module.params["project"]
+            project_uuid = resolved_uuids.get("project")
+            if project_uuid:
+                self._resolved_urls["project"] = self.resolver.resolve_to_url(
+                    "project", project_uuid
                 )
-                if project_url and "/" in project_url:
-                    project_uuid = project_url.rstrip("/").split("/")[-1]
 
             # Build query parameters
             query_params = {
@@ -90,8 +96,8 @@ class OrderRunner(BaseRunner):
             # Order modules typically use 'name_exact' for name filtering
             # We check context for specific name param name or default to 'name_exact'
             name_param = self.context.get("name_query_param", "name_exact")
-            if self.module.params.get("name"):
-                query_params[name_param] = self.module.params["name"]
+            if params.get("name"):
+                query_params[name_param] = params["name"]
 
             # Filter out terminated resources at the API level
             query_params["state"] = [
@@ -114,7 +120,7 @@ class OrderRunner(BaseRunner):
 
                 if len(active_resources) > 1:
                     self.module.fail_json(
-                        msg=f"Multiple active resources found for name '{self.module.params.get('name')}' in the specified offering. Please ensure resource names are unique."
+                        msg=f"Multiple active resources found for name '{params.get('name')}' in the specified offering. Please ensure resource names are unique."
                     )
                     return
 
@@ -167,6 +173,7 @@ class OrderRunner(BaseRunner):
             An empty list. The `run()` orchestrator interprets this as "execution for
             this phase is complete".
         """
+        params = self.module.params
         # If in check mode, we don't execute anything. We just predict that a
         # change will occur and let the `exit` method handle the diff.
         if self.module.check_mode:
@@ -176,20 +183,47 @@ class OrderRunner(BaseRunner):
         # --- 1. Validate required parameters ---
         required_for_create = self.context.get("required_for_create", [])
         for key in required_for_create:
-            if self.module.params.get(key) is None:
+            if params.get(key) is None:
                 self.module.fail_json(
                     msg=f"Parameter '{key}' is required when state is 'present' for a new resource."
                 )
 
-        project_url = self.resolver.resolve("project", self.module.params["project"])
-        offering_url = self.resolver.resolve("offering", self.module.params["offering"])
+        # Collect every value that has to be resolved for the order. The resolver
+        # issues independent lookups concurrently and defers the dependent ones
+        # (e.g. a flavor filtered by the offering's tenant) until their parent
+        # object is available.
+        attribute_values = {
+            key: value
+            for key in self.context["attribute_param_names"]
+            if (value := params.get(key)) is not None
+        }
+        # The project and offering URLs found by `check_existence` are reused
+        # instead of being resolved a second time, unless the full object is
+        # still needed.
+        reused = {
+            name: url
+            for name, url in self._resolved_urls.items()
+            if self.resolver.url_is_sufficient(name)
+        }
+        pending = {
+            "project": params["project"],
+            "offering": params["offering"],
+            **attribute_values,
+        }
+        resolved = {
+            **reused,
+            **self.resolver.resolve_many(
+                {name: value for name, value in pending.items() if name not in reused},
+                output_format="create",
+            ),
+        }
+        project_url = resolved["project"]
+        offering_url = resolved["offering"]
 
-        attributes = {"name": self.module.params["name"]}
-        for key in self.context["attribute_param_names"]:
-            if key in self.module.params and self.module.params[key] is not None:
-                attributes[key] = self.resolver.resolve(
-                    key, self.module.params[key], output_format="create"
-                )
+        attributes = {
+            "name": params["name"],
+            **{key: resolved[key] for key in attribute_values},
+        }
 
         transformed_attributes = self._apply_transformations(attributes)
 
@@ -200,10 +234,10 @@ class OrderRunner(BaseRunner):
             "attributes": transformed_attributes,
             "accepting_terms_of_service": True,
         }
-        if self.module.params.get("plan"):
-            order_payload["plan"] = self.module.params["plan"]
-        if self.module.params.get("limits"):
-            order_payload["limits"] = self.module.params["limits"]
+        if params.get("plan"):
+            order_payload["plan"] = params["plan"]
+        if params.get("limits"):
+            order_payload["limits"] = params["limits"]
 
         # Define the configuration for the generic waiter. This tells the BaseRunner
         # how to poll the order's status after it's created.
@@ -278,6 +312,7 @@ class OrderRunner(BaseRunner):
         Returns:
             A list containing one `DeleteCommand` configured for POST-based termination.
         """
+        params = self.module.params
         # Marketplace resources are terminated via a POST to a specific action endpoint,
         # using their unique `marketplace_resource_uuid`.
         uuid_to_terminate = self.resource["marketplace_resource_uuid"]
@@ -289,8 +324,8 @@ class OrderRunner(BaseRunner):
         attributes = {}
         term_attr_map = self.context.get("termination_attributes_map", {})
         for ansible_name, api_name in term_attr_map.items():
-            if self.module.params.get(ansible_name) is not None:
-                attributes[api_name] = self.module.params[ansible_name]
+            if params.get(ansible_name) is not None:
+                attributes[api_name] = params[ansible_name]
         if attributes:
             termination_payload["attributes"] = attributes
 
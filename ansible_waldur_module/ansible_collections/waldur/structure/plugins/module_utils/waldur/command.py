@@ -10,6 +10,23 @@ class Command:
     the "plan-and-execute" workflow.
     """
 
+    # A plan can hold many commands, so instances do without a per-instance
+    # `__dict__`.
+    __slots__ = (
+        "_final_path",
+        "_full_url",
+        "command_type",
+        "data",
+        "description",
+        "method",
+        "path",
+        "path_params",
+        "response",
+        "runner",
+        "status_code",
+        "wait_config",
+    )
+
     def __init__(
         self,
         runner,
@@ -47,6 +64,38 @@ class Command:
         self.wait_config = wait_config
         self.response = None
         self.status_code = 0
+        # The formatted endpoint path and full URL are computed on first use and
+        # reused by both `execute` and `serialize_request`.
+        self._final_path = None
+        self._full_url = None
+
+    @property
+    def final_path(self) -> str:
+        """
+        The endpoint path with the path parameters filled in.
+        """
+        if self._final_path is None:
+            if not self.path_params:
+                self._final_path = self.path
+            else:
+                try:
+                    self._final_path = self.path.format(**self.path_params)
+                except KeyError as e:
+                    # Fail early if a required placeholder is missing from the provided parameters.
+                    self.runner.module.fail_json(
+                        msg=f"Internal configuration error: Missing required path parameter in API call: {e}"
+                    )
+                    return self.path  # Unreachable
+        return self._final_path
+
+    @property
+    def full_url(self) -> str:
+        """
+        The absolute URL of the endpoint, as shown in the command output.
+        """
+        if self._full_url is None:
+            self._full_url = f"{self.runner.api_url}/{self.final_path.lstrip('/')}"
+        return self._full_url
 
     def execute(self) -> Any:
         """
@@ -56,8 +105,9 @@ class Command:
         Returns:
             The parsed JSON response from the API.
         """
+        # The path is formatted once here, so `send_request` does not have to.
         self.response, self.status_code = self.runner.send_request(
-            self.method, self.path, data=self.data, path_params=self.path_params
+            self.method, self.final_path, data=self.data
         )
         return self.response
 
@@ -66,19 +116,11 @@ class Command:
         Generates a serializable dictionary representing the HTTP request this
         command will make. This is used for Ansible's command output.
         """
-        # Format path with path_params if they exist.
-        final_path = self.path
-        if self.path_params:
-            final_path = self.path.format(**self.path_params)
-
-        # Build the full URL.
-        api_url = self.runner.module.params["api_url"].rstrip("/")
-        full_url = f"{api_url}/{final_path.lstrip('/')}"
-
-        # Assemble the final dictionary.
+        # Assemble the final dictionary. The formatted path and full URL are
+        # cached on the command, so repeated serialization is cheap.
         serialized: Dict[str, Union[str, dict]] = {
             "method": self.method,
-            "url": full_url,
+            "url": self.full_url,
             "description": self.description,
         }
         if self.data:
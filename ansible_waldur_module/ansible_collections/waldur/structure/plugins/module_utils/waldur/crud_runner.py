@@ -50,40 +50,51 @@ class CrudRunner(BaseRunner):
         Returns:
             A list containing one `CreateCommand` object.
         """
+        params = self.module.params
         # --- Step 1: Validate required parameters for creation ---
         required_for_create = self.context.get("required_for_create", [])
         for key in required_for_create:
-            if self.module.params.get(key) is None:
+            if params.get(key) is None:
                 self.module.fail_json(
                     msg=f"Parameter '{key}' is required when state is 'present' for a new resource."
                 )
 
-        # --- Step 2: Resolve Path Parameters using the (now populated) Cache ---
-        path_params = {}
+        # --- Step 2: Validate the parent resources of nested endpoints ---
         create_path_maps = self.context.get("path_param_maps", {}).get("create", {})
 
-        for path_param_key, ansible_param_name in create_path_maps.items():
-            parent_identifier = self.module.params.get(ansible_param_name)
-            if not parent_identifier:
+        for ansible_param_name in create_path_maps.values():
+            if not params.get(ansible_param_name):
                 self.module.fail_json(
                     msg=f"Parameter '{ansible_param_name}' is required for creation, as it defines the parent resource."
                 )
 
-            # This call will now work reliably because the resolver can handle its own dependencies.
-            resolved_url = self.resolver.resolve(ansible_param_name, parent_identifier)
-            path_params[path_param_key] = resolved_url.strip("/").split("/")[-1]
-
-        # --- Step 3: Assemble and Recursively Resolve the Request Body Payload ---
+        # --- Step 3: Resolve Path Parameters and the Request Body Payload ---
         # Get the topologically sorted list of model parameters from the context.
         sorted_model_params = self.context.get("model_param_names", [])
-        payload = {}
+        # A single lookup per key; omitted (None) parameters are left out.
+        payload_values = {
+            key: value
+            for key in sorted_model_params
+            if (value := params.get(key)) is not None
+        }
+
+        # Both the parent resources and the payload are resolved in a single batch.
+        # Independent lookups run concurrently, while the resolver still honours
+        # the dependency order, so values that filter by another parameter are
+        # only resolved once that parameter is in the cache.
+        resolved = self.resolver.resolve_many(
+            {
+                **{name: params[name] for name in create_path_maps.values()},
+                **payload_values,
+            }
+        )
+
+        path_params = {}
+        for path_param_key, ansible_param_name in create_path_maps.items():
+            resolved_url = resolved[ansible_param_name]
+            path_params[path_param_key] = self._uuid_from_url(resolved_url)
 
-        # Iterate in the correct dependency order.
-        for key in sorted_model_params:
-            if key in self.module.params and self.module.params[key] is not None:
-                # The `resolve` method will use the cache, which has been populated
-                # by previous iterations of this loop, to satisfy dependencies.
-                payload[key] = self.resolver.resolve(key, self.module.params[key])
+        payload = {key: resolved[key] for key in payload_values}
 
         return [
             Command(
@@ -156,7 +167,7 @@ class CrudRunner(BaseRunner):
                         )
 
                     # Extract the UUID from the end of the parent's URL.
-                    path_params[path_key] = parent_url.strip("/").split("/")[-1]
+                    path_params[path_key] = self._uuid_from_url(parent_url)
 
         # --- Step 2: Return the Final Command ---
         return [
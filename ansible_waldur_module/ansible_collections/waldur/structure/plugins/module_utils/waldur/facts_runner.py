@@ -12,6 +12,8 @@ parameters (like 'project' or 'tenant'), ensuring a clean separation of concerns
 and consistent logic across all module types.
 """
 
+from functools import partial
+
 from ansible_collections.waldur.structure.plugins.module_utils.waldur.base_runner import (
     BaseRunner,
 )
@@ -73,8 +75,9 @@ class FactsRunner(BaseRunner):
             A list of matching resource dictionaries. This method guarantees returning
             a list, even if it's empty, to provide a consistent return type.
         """
+        params = self.module.params
         identifier_param = self.context["identifier_param"]
-        value = self.module.params.get(identifier_param)
+        value = params.get(identifier_param)
 
         # --- Path 1: Direct Lookup by UUID (Most Efficient) ---
         # If the user provides a valid UUID as the main identifier, we can fetch the
@@ -95,24 +98,33 @@ class FactsRunner(BaseRunner):
         if value:
             query_params["name_exact"] = value
 
-        # Resolve all configured context parameters (e.g., 'project', 'tenant').
+        # Resolve all configured context parameters (e.g., 'project', 'tenant')
+        # that the user included in their playbook. The lookups are independent
+        # of each other, so they are issued concurrently.
         resolvers_config = self.context.get("resolvers", {})
-        for param_name, resolver_info in resolvers_config.items():
-            # Check if the user included this context parameter in their playbook.
-            if self.module.params.get(param_name):
+        context_params = [
+            param_name for param_name in resolvers_config if params.get(param_name)
+        ]
+        resolved_urls = self._run_concurrently(
+            [
                 # Delegate the resolution of the context parameter's name/UUID to our
                 # centralized resolver utility.
-                resolved_url = self.resolver.resolve_to_url(
-                    param_name=param_name, value=self.module.params[param_name]
+                partial(
+                    self.resolver.resolve_to_url,
+                    param_name=param_name,
+                    value=params[param_name],
                 )
+                for param_name in context_params
+            ]
+        )
 
-                # Extract the UUID from the end of the resolved URL.
-                if resolved_url:
-                    # Robustly get the last non-empty part of the URL path.
-                    resolved_uuid = resolved_url.strip("/").split("/")[-1]
-                    # Use the 'filter_key' from the context (e.g., 'project_uuid') to
-                    # add the final query parameter.
-                    query_params[resolver_info["filter_key"]] = resolved_uuid
+        for param_name, resolved_url in zip(context_params, resolved_urls):
+            # Extract the UUID from the end of the resolved URL.
+            if resolved_url:
+                resolved_uuid = self._uuid_from_url(resolved_url)
+                # Use the 'filter_key' from the context (e.g., 'project_uuid') to
+                # add the final query parameter.
+                query_params[resolvers_config[param_name]["filter_key"]] = resolved_uuid
 
         # Add inferred filter parameters to the query.
         inferred_filter_params = self.context.get("inferred_filter_params", [])
@@ -121,7 +133,7 @@ class FactsRunner(BaseRunner):
             if param_name in resolvers_config:
                 continue
 
-            param_value = self.module.params.get(param_name)
+            param_value = params.get(param_name)
             if param_value is not None:
                 query_params[param_name] = param_value
 
@@ -183,10 +195,15 @@ class FactsRunner(BaseRunner):
 
         if self.context.get("many", False):
             # For many=true, return a list under the 'resources' key.
-            result_payload["resources"] = resources
+            result_payload["resources"] = [
+                self._select_return_fields(resource) for resource in resources
+            ]
         else:
             # For many=false, we've already validated there is exactly one item.
             # Return the single dictionary under the 'resource' key.
-            result_payload["resource"] = resources[0] if resources else None
+            result_payload["resource"] = (
+                self._select_return_fields(resources[0]) if resources else None
+            )
 
+        self.close()
         self.module.exit_json(**result_payload)